@@ -1,10 +1,10 @@
 from openai import OpenAI
-import json
 from datetime import datetime
 import anthropic
 import os
 from abc import ABC, abstractmethod
 import conversation_node as CN
+import json_utils as JU
 from typing import Optional, Dict, Any
 
 
@@ -13,8 +13,10 @@ class BaseMailbox(ABC):
     Abstract base class for mailbox implementations.
     """
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, log_enabled: Optional[bool] = None):
         self.verbose = verbose  # currently unused. useful for debugging.
+        # None means "log if log_message has been overridden"; see _logging_enabled.
+        self.log_enabled = log_enabled
 
     def log_message(self, message: str) -> None:
         """
@@ -22,6 +24,16 @@ class BaseMailbox(ABC):
         """
         pass
 
+    def _logging_enabled(self) -> bool:
+        """
+        Returns whether send_message should build log entries for log_message.
+        """
+        if self.log_enabled is not None:
+            return self.log_enabled
+        # The base log_message is a no-op, so skip building entries unless it has
+        # been overridden on the class or assigned on the instance.
+        return "log_message" in vars(self) or type(self).log_message is not BaseMailbox.log_message
+
     def __formatted_datetime__(self) -> str:
         """
         Returns the current date and time in a formatted string.
@@ -41,38 +53,41 @@ class BaseMailbox(ABC):
         """
         Sends a message to the mailbox.
         """
-        message = {
-            "date": self.__formatted_datetime__(),
-            "messages": conversation.to_dict(),
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "model": model,
-        }
+        messages = conversation.to_dict()
+        log_enabled = self._logging_enabled()
 
-        self.log_message(json.dumps(message))
+        if log_enabled:
+            message = {
+                "date": self.__formatted_datetime__(),
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "model": model,
+            }
+            self.log_message(JU.json_dumps(message))
 
         try:
             response = self._send_message_implementation(
-                conversation, model, max_tokens, temperature, api_key
+                messages, model, max_tokens, temperature, api_key
             )
         except Exception as e:
             raise e
 
         response_text, response_role = self._process_response(response)
 
-        message = {
-            "date": self.__formatted_datetime__(),
-            "role": response_role,
-            "content": response_text,
-        }
-
-        self.log_message(json.dumps(message))
+        if log_enabled:
+            message = {
+                "date": self.__formatted_datetime__(),
+                "role": response_role,
+                "content": response_text,
+            }
+            self.log_message(JU.json_dumps(message))
         return response_text, response_role, response
 
     @abstractmethod
     def _send_message_implementation(
         self,
-        conversation: CN.ConversationNode,
+        messages: list[Dict[str, str]],
         model: str,
         max_tokens: int,
         temperature: float,
@@ -96,15 +111,17 @@ class OpenAIMailbox(BaseMailbox):
     OpenAI-based mailbox implementation.
     """
 
-    def __init__(self, api_key: Optional[str] = None, verbose: bool = False):
-        super().__init__(verbose)
+    def __init__(self, api_key: Optional[str] = None, verbose: bool = False, log_enabled: Optional[bool] = None):
+        super().__init__(verbose, log_enabled)
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key not provided.")
+        self.client: Optional[OpenAI] = None
+        self._client_key: Optional[str] = None
 
     def _send_message_implementation(
         self,
-        conversation: CN.ConversationNode,
+        messages: list[Dict[str, str]],
         model: str,
         max_tokens: int,
         temperature: float,
@@ -113,9 +130,11 @@ class OpenAIMailbox(BaseMailbox):
         """
         Sends a message using the OpenAI API.
         """
-        client = OpenAI(api_key=api_key)
-        return client.chat.completions.create(
-            messages=conversation.to_dict(),
+        if self.client is None or self._client_key != api_key:
+            self.client = OpenAI(api_key=api_key)
+            self._client_key = api_key
+        return self.client.chat.completions.create(
+            messages=messages,
             max_tokens=max_tokens,
             temperature=temperature,
             model=model,
@@ -133,15 +152,17 @@ class AnthropicMailbox(BaseMailbox):
     """
     Anthropic-based mailbox implementation.
     """
-    def __init__(self, api_key: Optional[str] = None, verbose: bool = False):
-        super().__init__(verbose)
+    def __init__(self, api_key: Optional[str] = None, verbose: bool = False, log_enabled: Optional[bool] = None):
+        super().__init__(verbose, log_enabled)
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("Anthropic API key not provided.")
+        self.client: Optional[anthropic.Anthropic] = None
+        self._client_key: Optional[str] = None
 
     def _send_message_implementation(
         self,
-        conversation: CN.ConversationNode,
+        messages: list[Dict[str, str]],
         model: str,
         max_tokens: int,
         temperature: float,
@@ -150,19 +171,21 @@ class AnthropicMailbox(BaseMailbox):
         """
         Sends a message using the Anthropic API.
         """
-        client = anthropic.Anthropic(api_key=api_key)
+        # Reuse the client, and with it the HTTP connection pool, across calls.
+        if self.client is None or self._client_key != api_key:
+            self.client = anthropic.Anthropic(api_key=api_key)
+            self._client_key = api_key
 
         # Anthropic API requires the first message to be from the user
-        def fix_messages(csvn: CN.ConversationNode) -> list[dict[str, str]]:
-            msg_dict = csvn.to_dict()
+        def fix_messages(msg_dict: list[dict[str, str]]) -> list[dict[str, str]]:
             if msg_dict[0]["role"] == "assistant":
                 if self.verbose:
                     Warning("Anthropic requires first message be from the user. Ignoring first message.")
                 msg_dict = msg_dict[1:]
             return msg_dict
 
-        return client.messages.create(
-            messages=fix_messages(conversation),
+        return self.client.messages.create(
+            messages=fix_messages(messages),
             max_tokens=max_tokens,
             temperature=temperature,
             model=model,
@@ -2,12 +2,34 @@ from abc import ABC, abstractmethod
 from enum import Enum
 import conversation_node as CN
 import bot_mailbox as MB
+import json_utils as JU
 import datetime as DT
 import re
-import json
 import os
 from typing import Optional, Union, Type, Dict, Any
 
+try:
+    # google-re2 matches in linear time without backtracking; fall back to re.
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+
+def _dump_json(data: Any, filepath: str) -> None:
+    """
+    Writes data to a JSON file.
+    """
+    with open(filepath, "w", encoding="utf-8") as file:
+        file.write(JU.json_dumps(data))
+
+
+def _load_json(filepath: str) -> Any:
+    """
+    Reads data from a JSON file.
+    """
+    with open(filepath, "rb") as file:
+        return JU.json_loads(file.read())
+
 
 class Engines(Enum):
     """
@@ -24,12 +46,10 @@ class Engines(Enum):
         """
         Returns the bot class based on the model engine.
         """
-        if model_engine in [Engines.GPT4, Engines.GPT35, Engines.GPT432k]:
-            return GPTBot
-        elif model_engine in [Engines.CLAUDE3OPUS, Engines.CLAUDE3SONNET]:
-            return AnthropicBot
-        else:
-            raise ValueError(f"Unsupported model engine: {model_engine}")
+        try:
+            return _ENGINE_TO_BOT_CLASS[model_engine]
+        except KeyError:
+            raise ValueError(f"Unsupported model engine: {model_engine}") from None
 
 
 class BaseBot(ABC):
@@ -37,6 +57,18 @@ class BaseBot(ABC):
     Abstract base class for bot implementations.
     """
 
+    __slots__ = (
+        "api_key",
+        "name",
+        "model_engine",
+        "max_tokens",
+        "temperature",
+        "role",
+        "role_description",
+        "conversation",
+        "mailbox",
+    )
+
     def __init__(
         self,
         api_key: Optional[str],
@@ -122,8 +154,7 @@ class BaseBot(ABC):
         """
         filename = f"{self.name}@{self.formatted_datetime()}.cvsn"
         data = conversation_root.to_dict()
-        with open(filename, "w") as file:
-            json.dump(data, file)
+        _dump_json(data, filename)
 
     @classmethod
     def load(cls, filepath: str) -> "BaseBot":
@@ -133,8 +164,7 @@ class BaseBot(ABC):
         _, extension = os.path.splitext(filepath)
 
         if extension == ".bot":
-            with open(filepath, "r") as file:
-                data = json.load(file)
+            data = _load_json(filepath)
 
             bot_class = globals()[data["bot_class"]]
             bot = bot_class(
@@ -153,8 +183,7 @@ class BaseBot(ABC):
             return bot
 
         elif extension == ".cvsn":
-            with open(filepath, "r") as file:
-                conversation_data = json.load(file)
+            conversation_data = _load_json(filepath)
 
             conversation_node = CN.ConversationNode.from_dict(conversation_data)
             return conversation_node
@@ -173,15 +202,15 @@ class BaseBot(ABC):
         data = {
             "bot_class": self.__class__.__name__,
             "name": self.name,
-            "model_engine": self.model_engine.value,
+            # Subclasses store the engine's string value, so normalize through Engines.
+            "model_engine": Engines(self.model_engine).value,
             "max_tokens": self.max_tokens,
             "temperature": self.temperature,
             "role": self.role,
             "role_description": self.role_description,
             "conversation": self.conversation.to_dict() if self.conversation else None,
         }
-        with open(filename, "w") as file:
-            json.dump(data, file)
+        _dump_json(data, filename)
 
     def converse(self) -> None:
         """
@@ -238,6 +267,8 @@ class GPTBot(BaseBot):
     ChatGPT-based bot implementation.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -247,11 +278,12 @@ class GPTBot(BaseBot):
         name: str = "bot",
         role: str = "assistant",
         role_description: str = "a friendly AI assistant",
+        log_enabled: Optional[bool] = None,
     ):
         super().__init__(api_key, model_engine.value, max_tokens, temperature, name, role, role_description)
         match model_engine:
             case Engines.GPT4 | Engines.GPT35 | Engines.GPT432k:
-                self.mailbox = MB.OpenAIMailbox(verbose=True)
+                self.mailbox = MB.OpenAIMailbox(verbose=True, log_enabled=log_enabled)
             case _:
                 raise Exception(f"model_engine: {model_engine} not found")
 
@@ -278,6 +310,8 @@ class AnthropicBot(BaseBot):
     Anthropic-based bot implementation.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -287,11 +321,12 @@ class AnthropicBot(BaseBot):
         name: str = "bot",
         role: str = "assistant",
         role_description: str = "a friendly AI assistant",
+        log_enabled: Optional[bool] = None,
     ):
         super().__init__(api_key, model_engine.value, max_tokens, temperature, name, role, role_description)
         match model_engine:
             case Engines.CLAUDE3OPUS | Engines.CLAUDE3SONNET:
-                self.mailbox = MB.AnthropicMailbox(verbose=True)
+                self.mailbox = MB.AnthropicMailbox(verbose=True, log_enabled=log_enabled)
             case _:
                 raise Exception(f"model_engine: {model_engine} not found")
 
@@ -313,23 +348,30 @@ class AnthropicBot(BaseBot):
         )
 
 
-def remove_code_blocks(text: str) -> list[str]:
+_ENGINE_TO_BOT_CLASS: Dict[Engines, Type[BaseBot]] = {
+    Engines.GPT4: GPTBot,
+    Engines.GPT432k: GPTBot,
+    Engines.GPT35: GPTBot,
+    Engines.CLAUDE3OPUS: AnthropicBot,
+    Engines.CLAUDE3SONNET: AnthropicBot,
+}
+
+
+_CODEBLOCK_RE = _regex.compile(r"```([a-zA-Z0-9_+-]+)?\s*([\s\S]*?)```")
+
+
+def remove_code_blocks(text: str) -> tuple[list[str], list[str]]:
     """
-    Extracts the content inside code blocks from the given text.
+    Extracts the content and language labels of code blocks from the given text.
     """
-    pattern = r"```(?:[a-zA-Z0-9_+-]+)?\s*([\s\S]*?)```"
+    if "```" not in text:
+        return [], []
     code_blocks = []
-    
-    while True:
-        match = re.search(pattern, text)
-        if match:
-            code_block = match.group(1).strip()
-            code_blocks.append(code_block)
-            text = text[:match.start()] + text[match.end():]
-        else:
-            break
-    
-    return code_blocks
+    labels = []
+    for match in _CODEBLOCK_RE.finditer(text):
+        code_blocks.append(match.group(2).strip())
+        labels.append(match.group(1) or "")
+    return code_blocks, labels
 
 
 if __name__ == "__main__":
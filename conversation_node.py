@@ -7,6 +7,8 @@ class ConversationNode:
     Represents a node in a conversation tree.
     """
 
+    __slots__ = ("role", "content", "replies", "parent", "_history")
+
     def __init__(
         self, role: str, content: str, parent: Optional["ConversationNode"] = None
     ):
@@ -58,11 +60,12 @@ class ConversationNode:
         """
         Converts the conversation node and its replies to a dictionary.
         """
+        conversation_dict = []
         node = self
-        conversation_dict = [{"role": node.role, "content": node.content}]
-        if node.parent is not None:
-            parent_dict = node.parent.to_dict()
-            conversation_dict = parent_dict + conversation_dict
+        while node is not None:
+            conversation_dict.append({"role": node.role, "content": node.content})
+            node = node.parent
+        conversation_dict.reverse()
         return conversation_dict
 
     @classmethod
@@ -88,14 +91,18 @@ class ConversationNode:
                     current_node = reply_node
             return root_node
         else:
-            role = data["role"]
-            content = data["content"]
-            node = cls(role, content)
-            for reply_data in data.get("replies", []):
-                reply_node = cls.from_dict(reply_data)
-                reply_node.parent = node
-                node.replies.append(reply_node)
-            return node
+            # Build the tree with an explicit stack so deep conversations cannot
+            # hit the recursion limit. Replies are attached in order on creation.
+            root_node = cls(data["role"], data["content"])
+            stack = [(data, root_node)]
+            while stack:
+                node_data, node = stack.pop()
+                for reply_data in node_data.get("replies", []):
+                    reply_node = cls(reply_data["role"], reply_data["content"])
+                    reply_node.parent = node
+                    node.replies.append(reply_node)
+                    stack.append((reply_data, reply_node))
+            return root_node
 
     def to_json(self) -> str:
         """
@@ -122,10 +129,13 @@ class ConversationNode:
 
     def __to_string__(self, level: int = 0) -> str:
         """
-        Recursively generates a string representation of the conversation tree.
+        Generates a string representation of the conversation tree, walking it
+        with an explicit stack so deep conversations cannot hit the recursion limit.
         """
-        indent = " " * level
-        result = f"{indent}{self.role}: {self.content}\n"
-        for reply in self.replies:
-            result += reply.__to_string__(level + 1)
-        return result
\ No newline at end of file
+        lines = []
+        stack = [(self, level)]
+        while stack:
+            node, depth = stack.pop()
+            lines.append(f"{' ' * depth}{node.role}: {node.content}\n")
+            stack.extend((reply, depth + 1) for reply in reversed(node.replies))
+        return "".join(lines)
\ No newline at end of file
@@ -1,11 +1,10 @@
+import sys
 import bots as bots
 
 def pretty(str, name=None):
-    if name is None:
-        print(str)
     if name is not None:
-        print(f"{name}: {str}")
-    print("\n---\n")
+        str = f"{name}: {str}"
+    sys.stdout.write(f"{str}\n\n---\n\n")
 
 P1 = bots.AnthropicBot(name="Claude")
 P2 = bots.GPTBot(name="ChatGPT")
@@ -0,0 +1,25 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serializes obj to a compact JSON string, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserializes a JSON string or bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)